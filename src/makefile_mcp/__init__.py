@@ -1,7 +1,11 @@
 """makefile-mcp: Auto-discover Makefile targets as MCP tools."""
 
-from .parser import MakeTarget, normalize_tool_name, parse_makefile
-from .server import create_server
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, NoReturn
+
+if TYPE_CHECKING:
+    from .parser import MakeTarget, normalize_tool_name, parse_makefile
+    from .server import create_server
 
 __version__ = "0.1.0"
 __all__ = [
@@ -12,19 +16,52 @@ __all__ = [
     "parse_makefile",
 ]
 
+# Public names resolved lazily so the CLI can answer --help/--version/--list
+# without importing FastMCP.
+_LAZY_ATTRS = {
+    "MakeTarget": "parser",
+    "normalize_tool_name": "parser",
+    "parse_makefile": "parser",
+    "create_server": "server",
+}
 
-def main() -> None:
-    """CLI entry point."""
-    import argparse
-    import fnmatch
-    import os
-    import sys
 
-    parser = argparse.ArgumentParser(
-        prog="makefile-mcp",
-        description="Auto-discover Makefile targets as MCP tools",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""\
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+
+    module = importlib.import_module(f".{module_name}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+_USAGE = """\
+usage: makefile-mcp [-h] [-V] [-m PATH] [-C PATH] [-i GLOB] [-e GLOB] [-p TEXT]
+                    [-t SECS] [-j N] [-l]
+"""
+
+_HELP = (
+    _USAGE
+    + """
+Auto-discover Makefile targets as MCP tools
+
+options:
+  -h, --help            show this help message and exit
+  -V, --version         show program's version number and exit
+  -m, --makefile PATH   Path to Makefile (default: ./Makefile)
+  -C, --cwd PATH        Working directory for make commands
+  -i, --include GLOB    Only include matching targets (comma-separated globs)
+  -e, --exclude GLOB    Exclude matching targets (comma-separated globs)
+  -p, --prefix TEXT     Tool name prefix (default: make_)
+  -t, --timeout SECS    Command timeout in seconds (default: 300)
+  -j, --max-concurrent N
+                        Maximum make processes at once (default: CPU count)
+  -l, --list            List discovered targets and exit
+
 Examples:
   makefile-mcp                          # Use ./Makefile
   makefile-mcp --list                   # Preview targets
@@ -33,55 +70,145 @@ Examples:
 
 Environment Variables:
   MAKEFILE_MCP_CWD                     # Default working directory (overridden by -C)
-""",
-    )
-    parser.add_argument(
-        "-V", "--version",
-        action="version",
-        version=f"%(prog)s {__version__}",
-    )
-    parser.add_argument(
-        "-m", "--makefile",
-        default="Makefile",
-        metavar="PATH",
-        help="Path to Makefile (default: ./Makefile)",
-    )
-    parser.add_argument(
-        "-C", "--cwd",
-        dest="working_dir",
-        metavar="PATH",
-        help="Working directory for make commands",
-    )
-    parser.add_argument(
-        "-i", "--include",
-        metavar="GLOB",
-        help="Only include matching targets (comma-separated globs)",
-    )
-    parser.add_argument(
-        "-e", "--exclude",
-        metavar="GLOB",
-        help="Exclude matching targets (comma-separated globs)",
-    )
-    parser.add_argument(
-        "-p", "--prefix",
-        default="make_",
-        metavar="TEXT",
-        help="Tool name prefix (default: make_)",
-    )
-    parser.add_argument(
-        "-t", "--timeout",
-        type=int,
-        default=300,
-        metavar="SECS",
-        help="Command timeout in seconds (default: 300)",
-    )
-    parser.add_argument(
-        "-l", "--list",
-        action="store_true",
-        help="List discovered targets and exit",
+"""
+)
+
+# Options taking a value: flag -> destination attribute
+_VALUE_OPTIONS = {
+    "-m": "makefile",
+    "--makefile": "makefile",
+    "-C": "working_dir",
+    "--cwd": "working_dir",
+    "-i": "include",
+    "--include": "include",
+    "-e": "exclude",
+    "--exclude": "exclude",
+    "-p": "prefix",
+    "--prefix": "prefix",
+    "-t": "timeout",
+    "--timeout": "timeout",
+    "-j": "max_concurrent",
+    "--max-concurrent": "max_concurrent",
+}
+
+# Long options, for resolving abbreviations such as --inc the way argparse does
+_LONG_OPTIONS = (
+    "--help",
+    "--version",
+    "--list",
+    *(flag for flag in _VALUE_OPTIONS if flag.startswith("--")),
+)
+
+
+def _usage_error(message: str) -> NoReturn:
+    import sys
+
+    sys.stderr.write(f"{_USAGE}makefile-mcp: error: {message}\n")
+    sys.exit(2)
+
+
+def _resolve_long_option(name: str) -> str:
+    """Expand a unique prefix of a long option to the full option name."""
+    if name in _LONG_OPTIONS:
+        return name
+    matches = [option for option in _LONG_OPTIONS if option.startswith(name)]
+    if len(matches) > 1:
+        _usage_error(f"ambiguous option: {name} could match {', '.join(matches)}")
+    return matches[0] if matches else name
+
+
+def _parse_args(argv: list[str]) -> SimpleNamespace:
+    """Parse command-line arguments.
+
+    A small hand-rolled replacement for argparse, which is comparatively
+    expensive to import and configure for a handful of flags.
+
+    Args:
+        argv: Arguments excluding the program name
+
+    Returns:
+        Namespace with makefile, working_dir, include, exclude, prefix,
+        timeout, max_concurrent and list attributes
+    """
+    import sys
+
+    args = SimpleNamespace(
+        makefile="Makefile",
+        working_dir=None,
+        include=None,
+        exclude=None,
+        prefix="make_",
+        timeout=300,
+        max_concurrent=None,
+        list=False,
     )
 
-    args = parser.parse_args()
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+
+        # "--" ends the options; there are no positional arguments to follow
+        if arg == "--":
+            if i < len(argv):
+                _usage_error(f"unrecognized arguments: {' '.join(argv[i:])}")
+            break
+
+        # Accept "--opt=value" and "-oVALUE" as well as "--opt value"
+        value: str | None = None
+        if arg.startswith("--"):
+            if "=" in arg:
+                arg, value = arg.split("=", 1)
+            arg = _resolve_long_option(arg)
+        elif len(arg) > 2 and arg[0] == "-":
+            if arg[:2] in _VALUE_OPTIONS:
+                arg, value = arg[:2], arg[2:]
+            else:
+                # Grouped flags: "-lX" is "-l" followed by "-X"
+                argv = [*argv[:i], f"-{arg[2:]}", *argv[i:]]
+                arg = arg[:2]
+
+        if arg in ("-h", "--help"):
+            sys.stdout.write(_HELP)
+            sys.exit(0)
+        if arg in ("-V", "--version"):
+            sys.stdout.write(f"makefile-mcp {__version__}\n")
+            sys.exit(0)
+        if arg in ("-l", "--list"):
+            if value is not None:
+                _usage_error(f"argument {arg}: ignored explicit argument {value!r}")
+            args.list = True
+            continue
+
+        dest = _VALUE_OPTIONS.get(arg)
+        if dest is None:
+            _usage_error(f"unrecognized arguments: {argv[i - 1]}")
+
+        if value is None:
+            if i >= len(argv):
+                _usage_error(f"argument {arg}: expected one argument")
+            value = argv[i]
+            i += 1
+
+        if dest in ("timeout", "max_concurrent"):
+            try:
+                setattr(args, dest, int(value))
+            except ValueError:
+                _usage_error(f"argument {arg}: invalid int value: {value!r}")
+            if dest == "max_concurrent" and args.max_concurrent < 1:
+                _usage_error(f"argument {arg}: must be at least 1")
+        else:
+            setattr(args, dest, value)
+
+    return args
+
+
+def main() -> None:
+    """CLI entry point."""
+    import os
+    import sys
+
+    args = _parse_args(sys.argv[1:])
 
     # Parse include/exclude patterns
     include = [p.strip() for p in args.include.split(",")] if args.include else None
@@ -92,24 +219,32 @@ Environment Variables:
 
     # List mode - show targets without starting server
     if args.list:
+        from .parser import normalize_tool_name, parse_makefile
+        from .patterns import compile_patterns
+
         try:
             targets = parse_makefile(args.makefile)
         except FileNotFoundError:
             print(f"Error: Makefile not found: {args.makefile}", file=sys.stderr)
             sys.exit(1)
 
+        include_match = compile_patterns(include)
+        exclude_match = compile_patterns(exclude)
+
         print(f"Discovered {len(targets)} targets:\n")
         for t in targets:
             tool_name = normalize_tool_name(t.name, args.prefix)
             skip = ""
-            if include and not any(fnmatch.fnmatch(t.name, p) for p in include):
+            if include_match and not include_match(t.name):
                 skip = " \033[90m[excluded by --include]\033[0m"
-            elif exclude and any(fnmatch.fnmatch(t.name, p) for p in exclude):
+            elif exclude_match and exclude_match(t.name):
                 skip = " \033[90m[excluded by --exclude]\033[0m"
             print(f"  \033[36m{tool_name:25}\033[0m {t.description}{skip}")
         sys.exit(0)
 
     # Create and run server
+    from .server import create_server
+
     try:
         server = create_server(
             makefile=args.makefile,
@@ -118,6 +253,7 @@ Environment Variables:
             exclude=exclude,
             prefix=args.prefix,
             timeout=args.timeout,
+            max_concurrent=args.max_concurrent,
         )
     except FileNotFoundError as e:
         print(f"Error: {e}", file=sys.stderr)
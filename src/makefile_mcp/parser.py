@@ -1,11 +1,47 @@
 """Makefile parser for extracting targets and descriptions."""
 
-import re
+import functools
+import os
+import stat
+import string
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 
+# Target names: [a-zA-Z_][a-zA-Z0-9_-]*
+_NAME_START = frozenset(string.ascii_letters + "_")
+_NAME_CHARS = _NAME_START | frozenset(string.digits + "-")
 
-@dataclass
+# Read size when stat() gives no useful size, e.g. for pipes
+_READ_CHUNK = 64 * 1024
+
+# Characters replaced with underscores in tool names
+_NAME_TRANS = str.maketrans({"-": "_", ":": "_"})
+
+
+def _parse_target_line(line: str) -> tuple[str, str] | None:
+    """Split a `target: [deps] ## description` line into name and description.
+
+    Returns None unless the line documents a target: the name must start
+    the line, and the first # after the colon must begin the ##.
+    """
+    name, colon, rest = line.partition(":")
+    if not colon:
+        return None
+    name = name.rstrip()
+    if not name or name[0] not in _NAME_START or not _NAME_CHARS.issuperset(name):
+        return None
+
+    _, hash_, description = rest.partition("#")
+    if not hash_ or description[:1] != "#":
+        return None
+    description = description[1:].rstrip("\n")
+    if not description:
+        return None
+    return name, description.strip()
+
+
+@dataclass(slots=True, frozen=True)
 class MakeTarget:
     """Represents a parsed Makefile target."""
 
@@ -17,6 +53,10 @@ class MakeTarget:
 def parse_makefile(makefile_path: str | Path) -> list[MakeTarget]:
     """Parse a Makefile and extract targets with ## descriptions.
 
+    Results for regular files are cached per (absolute path, mtime, size),
+    so parsing an unchanged Makefile again does not re-read it. Pipes and
+    other special files are read and parsed on every call.
+
     Args:
         makefile_path: Path to the Makefile
 
@@ -30,23 +70,51 @@ def parse_makefile(makefile_path: str | Path) -> list[MakeTarget]:
 
         Only targets with ## descriptions are extracted.
     """
-    content = Path(makefile_path).read_text()
-
-    # Find .PHONY targets
-    phony_pattern = r"\.PHONY\s*:\s*(.+)"
+    path = os.path.abspath(makefile_path)
+    st = os.stat(path)
+    if not stat.S_ISREG(st.st_mode):
+        # Pipes and the like report no useful size or mtime; don't cache them
+        return list(_parse_file(path, 0))
+    return list(_parse_makefile_cached(path, st.st_mtime_ns, st.st_size))
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_makefile_cached(path: str, mtime_ns: int, size: int) -> tuple[MakeTarget, ...]:
+    """Parse a regular Makefile; mtime_ns only serves as cache key."""
+    return _parse_file(path, size)
+
+
+def _parse_file(path: str, size: int) -> tuple[MakeTarget, ...]:
+    """Read and parse a Makefile, using size from stat() as a read hint."""
+    # For a regular file one read() of the stat() size usually gets it all;
+    # keep reading to EOF anyway, since the size can be short or zero
+    chunks: list[bytes] = []
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        while chunk := os.read(fd, max(size, _READ_CHUNK)):
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    content = b"".join(chunks).decode("utf-8")
+
+    # Cheap substring checks skip the vast majority of lines, which are
+    # neither .PHONY nor documented
     phony_targets: set[str] = set()
-    for match in re.finditer(phony_pattern, content):
-        phony_targets.update(match.group(1).split())
-
-    # Find targets with ## descriptions
-    # Pattern: target: [deps] ## description (same line only)
-    # Use [^#\n]* to prevent matching across newlines
-    target_pattern = r"^([a-zA-Z_][a-zA-Z0-9_-]*)\s*:[^#\n]*##\s*(.+)$"
-
+    documented: list[tuple[str, str]] = []
+    for line in content.splitlines():
+        if ".PHONY" in line:
+            declared = line.partition(".PHONY")[2].lstrip()
+            if declared.startswith(":"):
+                phony_targets.update(declared[1:].split())
+        if "##" in line:
+            parsed = _parse_target_line(line)
+            if parsed:
+                name, description = parsed
+                documented.append((sys.intern(name), description))
+
+    # .PHONY may be declared after the targets it lists
     targets: list[MakeTarget] = []
-    for match in re.finditer(target_pattern, content, re.MULTILINE):
-        name = match.group(1)
-        description = match.group(2).strip()
+    for name, description in documented:
         targets.append(
             MakeTarget(
                 name=name,
@@ -55,9 +123,10 @@ def parse_makefile(makefile_path: str | Path) -> list[MakeTarget]:
             )
         )
 
-    return targets
+    return tuple(targets)
 
 
+@functools.lru_cache(maxsize=1024)
 def normalize_tool_name(target_name: str, prefix: str = "make_") -> str:
     """Convert a Makefile target name to a valid MCP tool name.
 
@@ -69,5 +138,4 @@ def normalize_tool_name(target_name: str, prefix: str = "make_") -> str:
         Normalized tool name (e.g., "make_lint_fix", "make_build_prod")
     """
     # Replace hyphens and colons with underscores
-    normalized = re.sub(r"[-:]", "_", target_name)
-    return f"{prefix}{normalized}"
+    return prefix + target_name.translate(_NAME_TRANS)
@@ -0,0 +1,85 @@
+"""Glob matching for target include/exclude filters."""
+
+import fnmatch
+import re
+from collections.abc import Callable
+
+
+def _segment_at(name: str, segment: str, pos: int) -> bool:
+    """Check whether a glob segment (literal text plus ?) matches at pos."""
+    if pos + len(segment) > len(name):
+        return False
+    if "?" not in segment:
+        return name.startswith(segment, pos)
+    return all(c == "?" or c == name[pos + i] for i, c in enumerate(segment))
+
+
+def _segment_find(name: str, segment: str, start: int, end: int) -> int:
+    """Find the leftmost position of a glob segment within name[start:end]."""
+    if "?" not in segment:
+        return name.find(segment, start, end)
+    for pos in range(start, end - len(segment) + 1):
+        if _segment_at(name, segment, pos):
+            return pos
+    return -1
+
+
+def _glob_match(segments: tuple[str, ...], name: str) -> bool:
+    """Match a name against a glob pre-split on * into segments."""
+    if len(segments) == 1:
+        return len(name) == len(segments[0]) and _segment_at(name, segments[0], 0)
+
+    first, *middle, last = segments
+    end = len(name) - len(last)
+    if end < len(first):
+        return False
+    if not _segment_at(name, first, 0) or not _segment_at(name, last, end):
+        return False
+
+    # Greedy leftmost placement of the segments between stars is sufficient
+    pos = len(first)
+    for segment in middle:
+        found = _segment_find(name, segment, pos, end)
+        if found < 0:
+            return False
+        pos = found + len(segment)
+    return True
+
+
+def compile_patterns(patterns: list[str] | None) -> Callable[[str], bool] | None:
+    """Compile glob patterns into a single matcher function.
+
+    Literal patterns are checked with a set lookup, patterns using only * and
+    ? are matched with plain string operations, and patterns with character
+    classes fall back to fnmatch's regex translation.
+
+    Args:
+        patterns: Glob patterns (e.g., ["deploy", "*-prod"]), or None
+
+    Returns:
+        Function returning True if a name matches any of the globs,
+        or None if there are no patterns
+    """
+    if not patterns:
+        return None
+
+    literals: set[str] = set()
+    globs: list[tuple[str, ...]] = []
+    classes: list[str] = []
+    for p in patterns:
+        if "[" in p:
+            classes.append(fnmatch.translate(p))
+        elif "*" in p or "?" in p:
+            globs.append(tuple(p.split("*")))
+        else:
+            literals.add(p)
+    regex = re.compile("|".join(classes)) if classes else None
+
+    def matches(name: str) -> bool:
+        if name in literals:
+            return True
+        if any(_glob_match(g, name) for g in globs):
+            return True
+        return regex is not None and regex.match(name) is not None
+
+    return matches
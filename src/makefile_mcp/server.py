@@ -1,20 +1,38 @@
 """FastMCP server that auto-discovers Makefile targets as tools."""
 
 import asyncio
-import fnmatch
+import contextlib
+import functools
 import os
+import re
+import shlex
+import signal
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 from subprocess import PIPE
-from typing import Callable
+from typing import Any
 
 from fastmcp import FastMCP
 
 from .parser import MakeTarget, normalize_tool_name, parse_makefile
+from .patterns import compile_patterns
 
 # Module-level state for dynamic working directory configuration
 # Precedence: tool setting > env var > cli arg > None
 _current_working_dir: str | None = None
 
+# Upper bound on captured output per stream; only the tail is kept beyond this
+MAX_OUTPUT_BYTES = 10 * 1024 * 1024
+
+_READ_CHUNK = 64 * 1024
+
+# How long to wait for pipes to close after killing make's process group
+_KILL_GRACE = 1.0
+
+# Targets passed to make; a leading "-" would be read as an option and an "="
+# as a variable assignment, so neither is accepted
+_VALID_TARGET_RE = re.compile(r"[A-Za-z0-9_.][A-Za-z0-9_./:-]*")
+
 
 def set_working_directory(path: str | None) -> str:
     """Set the working directory for all make commands.
@@ -51,6 +69,101 @@ def get_working_directory() -> str | None:
     return _current_working_dir
 
 
+@functools.lru_cache(maxsize=32)
+def _make_argv_prefix(makefile: str) -> tuple[bytes, ...]:
+    """Build the encoded `make -f <makefile>` argv prefix once per Makefile."""
+    return (b"make", b"-f", os.fsencode(makefile))
+
+
+async def _drain(stream: asyncio.StreamReader, limit: int) -> bytearray:
+    """Read a stream to EOF, keeping at most the last `limit` bytes."""
+    buf = bytearray()
+    truncated = False
+    while chunk := await stream.read(_READ_CHUNK):
+        buf += chunk
+        if len(buf) > limit:
+            del buf[: len(buf) - limit]
+            truncated = True
+
+    if truncated:
+        buf[:0] = b"[... output truncated ...]\n"
+    return buf
+
+
+async def _terminate(
+    proc: asyncio.subprocess.Process, tasks: tuple[asyncio.Future[Any], ...]
+) -> None:
+    """Kill make's process group and stop waiting on its output."""
+    # make runs in its own session, so one killpg() also kills the commands it
+    # started, which would otherwise keep the pipes open
+    with contextlib.suppress(ProcessLookupError):
+        os.killpg(proc.pid, signal.SIGKILL)
+
+    # Children that left the group can still hold the pipes; don't wait forever
+    await asyncio.wait(tasks, timeout=_KILL_GRACE)
+    for task in tasks:
+        task.cancel()
+
+
+async def _execute(
+    cmd: list[bytes],
+    cwd: str | None,
+    timeout: int,
+    max_output: int,
+    remaining: float | None = None,
+) -> str:
+    """Run a make command line and format its result.
+
+    remaining is the part of timeout still left, if some was already spent.
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=PIPE,
+            stderr=PIPE,
+            cwd=cwd,
+            start_new_session=True,
+        )
+    except Exception as e:
+        return f"Failed to execute: {e}"
+
+    # Drain both pipes concurrently into bounded buffers. The deadline covers
+    # the drains too: a background child can keep the pipes open after make
+    # itself has exited.
+    assert proc.stdout is not None and proc.stderr is not None
+    stdout_task = asyncio.create_task(_drain(proc.stdout, max_output))
+    stderr_task = asyncio.create_task(_drain(proc.stderr, max_output))
+    tasks = (asyncio.ensure_future(proc.wait()), stdout_task, stderr_task)
+    try:
+        _, pending = await asyncio.wait(tasks, timeout=timeout if remaining is None else remaining)
+    except BaseException:
+        # The tool call was cancelled; don't leave make running behind it
+        await _terminate(proc, tasks)
+        raise
+    if pending:
+        await _terminate(proc, tasks)
+        return f"Command timed out after {timeout} seconds"
+
+    stdout = stdout_task.result()
+    stderr = stderr_task.result()
+
+    # Decode straight into the result instead of building intermediate strings
+    if proc.returncode != 0:
+        parts = [f"Exit code {proc.returncode}:\n"]
+        if stderr:
+            parts.append(stderr.decode(errors="replace"))
+        parts.append("\n")
+        if stdout:
+            parts.append(stdout.decode(errors="replace"))
+        return "".join(parts)
+
+    if stdout:
+        return stdout.decode(errors="replace")
+    if stderr:
+        return stderr.decode(errors="replace")
+    return "(no output)"
+
+
 async def run_make(
     makefile: str,
     target: str,
@@ -58,6 +171,8 @@ async def run_make(
     args: str = "",
     dry_run: bool = False,
     timeout: int = 300,
+    max_output: int = MAX_OUTPUT_BYTES,
+    semaphore: asyncio.Semaphore | None = None,
 ) -> str:
     """Execute a make target and return output.
 
@@ -68,6 +183,9 @@ async def run_make(
         args: Additional arguments
         dry_run: If True, use make -n
         timeout: Timeout in seconds
+        max_output: Maximum bytes of stdout and of stderr to keep (the tail)
+        semaphore: Held while make runs, to bound concurrent processes;
+            waiting for it counts towards timeout
 
     Returns:
         Command output or error message
@@ -84,36 +202,36 @@ async def run_make(
     # Resolve working directory with precedence chain
     # Note: working_dir parameter already includes env var resolution from __init__.py
     resolved_working_dir = _current_working_dir or working_dir
-    cmd = ["make", "-f", makefile]
+    if not _VALID_TARGET_RE.fullmatch(target):
+        return f"Invalid target: {target!r}"
+
+    # Arguments go straight to make via exec; no shell is involved
+    cmd = list(_make_argv_prefix(makefile))
     if dry_run:
-        cmd.append("-n")
-    cmd.append(target)
+        cmd.append(b"-n")
+    cmd.append(os.fsencode(target))
     if args:
-        cmd.extend(args.split())
+        try:
+            cmd.extend(map(os.fsencode, shlex.split(args)))
+        except ValueError as e:
+            return f"Invalid arguments: {e}"
 
+    if semaphore is None:
+        return await _execute(cmd, resolved_working_dir, timeout, max_output)
+
+    # The timeout covers waiting for a free slot as well as running make
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
     try:
-        proc = await asyncio.create_subprocess_exec(
-            *cmd,
-            stdout=PIPE,
-            stderr=PIPE,
-            cwd=resolved_working_dir,
-        )
-        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=timeout)
+        await asyncio.wait_for(semaphore.acquire(), timeout)
     except asyncio.TimeoutError:
-        # Kill the process to prevent resource leak
-        proc.kill()
-        await proc.wait()
         return f"Command timed out after {timeout} seconds"
-    except Exception as e:
-        return f"Failed to execute: {e}"
-
-    output = stdout.decode() if stdout else ""
-    errors = stderr.decode() if stderr else ""
-
-    if proc.returncode != 0:
-        return f"Exit code {proc.returncode}:\n{errors}\n{output}"
-
-    return output or errors or "(no output)"
+    try:
+        return await _execute(
+            cmd, resolved_working_dir, timeout, max_output, max(deadline - loop.time(), 0)
+        )
+    finally:
+        semaphore.release()
 
 
 def create_server(
@@ -123,6 +241,7 @@ def create_server(
     exclude: list[str] | None = None,
     prefix: str = "make_",
     timeout: int = 300,
+    max_concurrent: int | None = None,
 ) -> FastMCP:
     """Create a FastMCP server with auto-discovered Makefile targets.
 
@@ -133,30 +252,38 @@ def create_server(
         exclude: Glob patterns for targets to exclude (None = none)
         prefix: Prefix for tool names
         timeout: Command timeout in seconds
+        max_concurrent: Maximum make processes running at once
+            (default: number of CPUs)
 
     Returns:
         Configured FastMCP server
     """
-    # Resolve paths
-    makefile_path = Path(makefile).resolve()
-    if not makefile_path.exists():
-        raise FileNotFoundError(f"Makefile not found: {makefile_path}")
+    # Resolve paths; only follow symlinks when the Makefile is one
+    abs_path = os.path.abspath(makefile)
+    if not os.path.isfile(abs_path):
+        raise FileNotFoundError(f"Makefile not found: {abs_path}")
+    makefile_path = Path(abs_path)
+    if os.path.islink(abs_path):
+        makefile_path = makefile_path.resolve()
 
     # Parse targets
     all_targets = parse_makefile(makefile_path)
 
     # Filter targets
-    def matches_patterns(name: str, patterns: list[str]) -> bool:
-        return any(fnmatch.fnmatch(name, p) for p in patterns)
+    include_match = compile_patterns(include)
+    exclude_match = compile_patterns(exclude)
 
     filtered: list[MakeTarget] = []
     for t in all_targets:
-        if include and not matches_patterns(t.name, include):
+        if include_match and not include_match(t.name):
             continue
-        if exclude and matches_patterns(t.name, exclude):
+        if exclude_match and exclude_match(t.name):
             continue
         filtered.append(t)
 
+    # Tool names are shared by the tool registrations and the targets resource
+    tools = [(normalize_tool_name(t.name, prefix), t) for t in filtered]
+
     # Create server
     server = FastMCP(
         name="makefile-mcp",
@@ -178,8 +305,7 @@ def create_server(
     def get_target_list() -> str:
         """Get a summary of all available Make targets."""
         lines = [f"# Available targets in {makefile_path.name}\n"]
-        for t in filtered:
-            tool_name = normalize_tool_name(t.name, prefix)
+        for tool_name, t in tools:
             phony = " [PHONY]" if t.is_phony else ""
             lines.append(f"- **{tool_name}**: {t.description}{phony}")
         return "\n".join(lines)
@@ -188,35 +314,38 @@ def create_server(
     # Tools - One per Makefile target
     # =========================================================================
 
-    for target in filtered:
-        tool_name = normalize_tool_name(target.name, prefix)
-
-        # Create tool function with closure
-        def make_tool_factory(t: MakeTarget) -> Callable:
-            async def tool_fn(
-                args: str = "",
-                dry_run: bool = False,
-            ) -> str:
-                """Run this make target.
-
-                Args:
-                    args: Additional arguments to pass to make (e.g., "VERBOSE=1")
-                    dry_run: If True, show commands without executing (make -n)
-                """
-                return await run_make(
-                    str(makefile_path),
-                    t.name,
-                    working_dir=working_dir,
-                    args=args,
-                    dry_run=dry_run,
-                    timeout=timeout,
-                )
-
-            return tool_fn
-
-        # Register the tool
-        server.tool(name=tool_name, description=target.description)(
-            make_tool_factory(target)
+    makefile_str = str(makefile_path)
+    semaphore = asyncio.Semaphore(max_concurrent or os.cpu_count() or 1)
+
+    # Shared by every tool; FastMCP needs a real function per tool (it rejects
+    # functools.partial), so each one only closes over its target name.
+    async def dispatch(target_name: str, args: str, dry_run: bool) -> str:
+        return await run_make(
+            makefile_str,
+            target_name,
+            working_dir=working_dir,
+            args=args,
+            dry_run=dry_run,
+            timeout=timeout,
+            semaphore=semaphore,
         )
 
+    def make_tool(target_name: str) -> Callable[..., Awaitable[str]]:
+        async def tool_fn(
+            args: str = "",
+            dry_run: bool = False,
+        ) -> str:
+            """Run this make target.
+
+            Args:
+                args: Additional arguments to pass to make (e.g., "VERBOSE=1")
+                dry_run: If True, show commands without executing (make -n)
+            """
+            return await dispatch(target_name, args, dry_run)
+
+        return tool_fn
+
+    for tool_name, target in tools:
+        server.tool(name=tool_name, description=target.description)(make_tool(target.name))
+
     return server
@@ -0,0 +1,124 @@
+"""Tests for command-line argument parsing."""
+
+import pytest
+
+from makefile_mcp import __version__, _parse_args
+
+
+class TestParseArgs:
+    """Tests for _parse_args function."""
+
+    def test_defaults(self) -> None:
+        """Should use defaults when no arguments are given."""
+        args = _parse_args([])
+
+        assert args.makefile == "Makefile"
+        assert args.working_dir is None
+        assert args.include is None
+        assert args.exclude is None
+        assert args.prefix == "make_"
+        assert args.timeout == 300
+        assert args.max_concurrent is None
+        assert args.list is False
+
+    def test_long_options(self) -> None:
+        """Should accept long options with separate values."""
+        args = _parse_args(
+            [
+                "--makefile",
+                "build.mk",
+                "--cwd",
+                "/tmp/project",
+                "--include",
+                "test,lint",
+                "--exclude",
+                "deploy",
+                "--prefix",
+                "proj_",
+                "--timeout",
+                "60",
+                "--list",
+            ]
+        )
+
+        assert args.makefile == "build.mk"
+        assert args.working_dir == "/tmp/project"
+        assert args.include == "test,lint"
+        assert args.exclude == "deploy"
+        assert args.prefix == "proj_"
+        assert args.timeout == 60
+        assert args.list is True
+
+    def test_short_and_attached_options(self) -> None:
+        """Should accept short options, -oVALUE and --opt=VALUE forms."""
+        args = _parse_args(["-mbuild.mk", "-C", "/tmp/project", "--prefix=", "-l"])
+
+        assert args.makefile == "build.mk"
+        assert args.working_dir == "/tmp/project"
+        assert args.prefix == ""
+        assert args.list is True
+
+    def test_long_option_prefixes(self) -> None:
+        """Should accept unique prefixes of long options, like argparse."""
+        args = _parse_args(["--make", "build.mk", "--inc=test", "--ex", "deploy", "--time", "60"])
+
+        assert args.makefile == "build.mk"
+        assert args.include == "test"
+        assert args.exclude == "deploy"
+        assert args.timeout == 60
+
+    def test_grouped_flags(self) -> None:
+        """Should split grouped short flags."""
+        args = _parse_args(["-lmbuild.mk"])
+
+        assert args.list is True
+        assert args.makefile == "build.mk"
+
+    def test_max_concurrent(self) -> None:
+        """Should parse the concurrency limit as an integer."""
+        assert _parse_args(["-j", "4"]).max_concurrent == 4
+        assert _parse_args(["--max-concurrent=2"]).max_concurrent == 2
+
+    def test_end_of_options(self) -> None:
+        """Should accept a bare -- marking the end of options."""
+        args = _parse_args(["--list", "--"])
+
+        assert args.list is True
+
+    def test_version(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Should print the version and exit successfully."""
+        with pytest.raises(SystemExit) as exc_info:
+            _parse_args(["--version"])
+
+        assert exc_info.value.code == 0
+        assert capsys.readouterr().out == f"makefile-mcp {__version__}\n"
+
+    def test_help(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Should print help and exit successfully."""
+        with pytest.raises(SystemExit) as exc_info:
+            _parse_args(["-h"])
+
+        assert exc_info.value.code == 0
+        assert "--makefile PATH" in capsys.readouterr().out
+
+    @pytest.mark.parametrize(
+        ("argv", "message"),
+        [
+            (["--bogus"], "unrecognized arguments: --bogus"),
+            (["-m"], "argument -m: expected one argument"),
+            (["--timeout", "soon"], "invalid int value: 'soon'"),
+            (["--", "extra"], "unrecognized arguments: extra"),
+            (["--list=yes"], "ignored explicit argument 'yes'"),
+            (["-j", "0"], "argument -j: must be at least 1"),
+            (["--m", "x"], "ambiguous option: --m could match --makefile, --max-concurrent"),
+        ],
+    )
+    def test_usage_errors(
+        self, argv: list[str], message: str, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Should report usage errors on stderr and exit with status 2."""
+        with pytest.raises(SystemExit) as exc_info:
+            _parse_args(argv)
+
+        assert exc_info.value.code == 2
+        assert message in capsys.readouterr().err
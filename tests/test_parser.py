@@ -1,5 +1,7 @@
 """Tests for Makefile parser."""
 
+import dataclasses
+import os
 from pathlib import Path
 
 import pytest
@@ -78,6 +80,62 @@ class TestParseMakefile:
         assert by_name["test"].is_phony is True
         assert by_name["deploy"].is_phony is False  # Not in .PHONY
 
+    def test_targets_are_immutable(self, makefile_path: Path) -> None:
+        """Should return frozen targets, which are safe to share from the cache."""
+        target = parse_makefile(makefile_path)[0]
+
+        assert isinstance(target, MakeTarget)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            target.name = "other"  # type: ignore[misc]
+
+    def test_phony_declared_after_target(self, tmp_path: Path) -> None:
+        """Should honour .PHONY declarations that follow the target."""
+        makefile = tmp_path / "Makefile"
+        makefile.write_text("build: ## Build it\n\ttrue\n\n.PHONY: build\n")
+
+        targets = parse_makefile(makefile)
+
+        assert [(t.name, t.is_phony) for t in targets] == [("build", True)]
+
+    def test_reparses_modified_file(self, makefile_path: Path) -> None:
+        """Should not serve cached results once the Makefile changes."""
+        assert "extra" not in [t.name for t in parse_makefile(makefile_path)]
+
+        with makefile_path.open("a") as f:
+            f.write("extra: ## Added later\n\ttrue\n")
+
+        assert "extra" in [t.name for t in parse_makefile(makefile_path)]
+
+    def test_handles_short_reads(
+        self, makefile_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Should keep reading when read() returns fewer bytes than requested."""
+        expected = parse_makefile(makefile_path)
+        makefile_path.write_text(makefile_path.read_text() + "\n")
+
+        read = os.read
+        monkeypatch.setattr(os, "read", lambda fd, n: read(fd, min(n, 7)))
+
+        assert parse_makefile(makefile_path) == expected
+
+    def test_parses_fifo(self, makefile_path: Path, tmp_path: Path) -> None:
+        """Should read a pipe to EOF even though stat() reports no size."""
+        import threading
+
+        fifo = tmp_path / "fifo"
+        os.mkfifo(fifo)
+        content = makefile_path.read_text()
+        expected = parse_makefile(makefile_path)
+
+        for _ in range(2):
+            writer = threading.Thread(target=fifo.write_text, args=(content,))
+            writer.start()
+            try:
+                # Parsed afresh each time, not served from the cache
+                assert parse_makefile(fifo) == expected
+            finally:
+                writer.join()
+
     def test_handles_missing_file(self, tmp_path: Path) -> None:
         """Should raise error for missing Makefile."""
         with pytest.raises(FileNotFoundError):
@@ -0,0 +1,50 @@
+"""Tests for target glob matching."""
+
+import fnmatch
+
+import pytest
+
+from makefile_mcp.patterns import compile_patterns
+
+
+class TestCompilePatterns:
+    """Tests for compile_patterns function."""
+
+    def test_returns_none_without_patterns(self) -> None:
+        """Should return None when there is nothing to match."""
+        assert compile_patterns(None) is None
+        assert compile_patterns([]) is None
+
+    def test_matches_literal_names(self) -> None:
+        """Should match literal patterns exactly."""
+        matches = compile_patterns(["test", "lint"])
+        assert matches is not None
+
+        assert matches("test")
+        assert matches("lint")
+        assert not matches("test-all")
+        assert not matches("format")
+
+    def test_matches_globs(self) -> None:
+        """Should support * and ? wildcards and character classes."""
+        matches = compile_patterns(["*-prod", "lint:?", "docker-[ab]"])
+        assert matches is not None
+
+        assert matches("build-prod")
+        assert matches("lint:x")
+        assert matches("docker-a")
+        assert not matches("lint:fix")
+        assert not matches("docker-c")
+        assert not matches("build-prod-2")
+
+    @pytest.mark.parametrize(
+        "pattern",
+        ["*", "a*", "*a", "*a*", "a*b*c", "?", "a?c", "*?*", "a**c", "*b?d*", "ab?", ""],
+    )
+    @pytest.mark.parametrize("name", ["", "a", "abc", "abcd", "aXbYc", "bcd", "ac", "acac"])
+    def test_agrees_with_fnmatch(self, pattern: str, name: str) -> None:
+        """Should give the same answer as fnmatch for * and ? globs."""
+        matches = compile_patterns([pattern])
+        assert matches is not None
+
+        assert matches(name) == fnmatch.fnmatchcase(name, pattern)